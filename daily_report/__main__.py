@@ -752,8 +752,7 @@ def main():
         format_slides(report, output_path)
         print(f"Slides written to {output_path}", file=sys.stderr)
     else:
-        output = format_markdown(report)
-        print(output)
+        format_markdown(report, sys.stdout)
 
 
 if __name__ == "__main__":
@@ -2,78 +2,114 @@
 
 from __future__ import annotations
 
-from daily_report.report_data import ReportData
+from itertools import chain
+from typing import TextIO
 
+from daily_report.report_data import (
+    ReportData, AuthoredPR, ReviewedPR, WaitingPR,
+)
 
-def format_markdown(report: ReportData) -> str:
-    """Render the report as a Markdown string.
+# Statuses for which line additions/deletions are shown
+_OPEN_STATUSES = frozenset({"Open", "Draft"})
+
+# Section headers and empty-section placeholders
+_HEADER_AUTHORED = "**Authored / Contributed PRs**"
+_HEADER_REVIEWED = "**Reviewed / Approved PRs**"
+_HEADER_WAITING = "**Waiting for review**"
+_EMPTY_AUTHORED = "_No authored or contributed PRs._"
+_EMPTY_REVIEWED = "_No reviewed or approved PRs._"
+_EMPTY_WAITING = "_No PRs waiting for review._"
+
+_SUMMARY_TEMPLATE = (
+    "**Summary:** {total} PRs across {repos} repos, "
+    "{merged} {label}, {open} still open. "
+    "Key themes: {themes}."
+)
+
+
+def format_markdown(report: ReportData, out: TextIO | None = None) -> str | None:
+    """Render the report as Markdown.
 
     Args:
         report: Complete report data.
+        out: Optional text stream. When given, the report is written to it
+            line by line (each line newline-terminated) instead of being
+            joined into one string.
 
     Returns:
-        The full Markdown report as a single string.
+        The full Markdown report as a single string, or None if *out* was given.
     """
-    lines: list[str] = []
-    is_range = report.summary.is_range
-
-    if is_range:
-        lines.append(f"# Daily Report \u2014 {report.date_from} .. {report.date_to}")
-    else:
-        lines.append(f"# Daily Report \u2014 {report.date_from}")
-    lines.append("")
-
-    # Authored / Contributed PRs
-    lines.append("**Authored / Contributed PRs**")
-    lines.append("")
-    if report.authored_prs:
-        for d in report.authored_prs:
-            stats = ""
-            if d.status in ("Open", "Draft"):
-                stats = f" (+{d.additions}/\u2212{d.deletions})"
-            author_info = ""
-            if d.contributed and d.original_author:
-                author_info = f" ({d.original_author})"
-            lines.append(
-                f"- `{d.repo}` \u2014 {d.title} #{d.number}{author_info} \u2014 **{d.status}**{stats}"
-            )
-    else:
-        lines.append("_No authored or contributed PRs._")
-    lines.append("")
-
-    # Reviewed / Approved PRs
-    lines.append("**Reviewed / Approved PRs**")
-    lines.append("")
-    if report.reviewed_prs:
-        for pr in report.reviewed_prs:
-            lines.append(
-                f"- `{pr.repo}` \u2014 {pr.title} #{pr.number} ({pr.author}) \u2014 **{pr.status}**"
-            )
-    else:
-        lines.append("_No reviewed or approved PRs._")
-    lines.append("")
-
-    # Waiting for review
-    lines.append("**Waiting for review**")
-    lines.append("")
-    if report.waiting_prs:
-        for w in report.waiting_prs:
-            reviewer_names = ", ".join(f"**{r}**" for r in w.reviewers)
-            lines.append(
-                f"- `{w.repo}` \u2014 {w.title} #{w.number} \u2014 reviewer: {reviewer_names} \u2014 since {w.created_at} ({w.days_waiting} days)"
-            )
-    else:
-        lines.append("_No PRs waiting for review._")
-    lines.append("")
-
-    # Summary
+    # Per-report invariants, resolved once before any per-PR work
     s = report.summary
+    if s.is_range:
+        header = f"# Daily Report \u2014 {report.date_from} .. {report.date_to}"
+        merged_label = "merged"
+    else:
+        header = f"# Daily Report \u2014 {report.date_from}"
+        merged_label = "merged today"
     themes_str = ", ".join(s.themes) if s.themes else "general development"
-    merged_label = "merged" if is_range else "merged today"
-    lines.append(
-        f"**Summary:** {s.total_prs} PRs across {s.repo_count} repos, "
-        f"{s.merged_count} {merged_label}, {s.open_count} still open. "
-        f"Key themes: {themes_str}."
+
+    # Single pass over all PRs, bullets bucketed by section
+    buffers: dict[type, list[str]] = {AuthoredPR: [], ReviewedPR: [], WaitingPR: []}
+    for pr in chain(report.authored_prs, report.reviewed_prs, report.waiting_prs):
+        cls = type(pr)
+        buffers[cls].append(_LINE_FORMATTERS[cls](pr))
+    authored_lines = buffers[AuthoredPR] or [_EMPTY_AUTHORED]
+    reviewed_lines = buffers[ReviewedPR] or [_EMPTY_REVIEWED]
+    waiting_lines = buffers[WaitingPR] or [_EMPTY_WAITING]
+
+    summary_line = _SUMMARY_TEMPLATE.format_map({
+        "total": s.total_prs,
+        "repos": s.repo_count,
+        "merged": s.merged_count,
+        "label": merged_label,
+        "open": s.open_count,
+        "themes": themes_str,
+    })
+
+    parts = [
+        header, "",
+        _HEADER_AUTHORED, "", *authored_lines, "",
+        _HEADER_REVIEWED, "", *reviewed_lines, "",
+        _HEADER_WAITING, "", *waiting_lines, "",
+        summary_line,
+    ]
+    if out is None:
+        return "\n".join(parts)
+    out.writelines(f"{line}\n" for line in parts)
+    return None
+
+
+# --- internal helpers (private) ---
+
+
+def _authored_pr_line(pr: AuthoredPR) -> str:
+    """Build a Markdown bullet line for an authored/contributed PR."""
+    return (
+        f"- `{pr.repo}` \u2014 {pr.title} #{pr.number}"
+        f"{f' ({pr.original_author})' if pr.contributed and pr.original_author else ''}"
+        f" \u2014 **{pr.status}**"
+        # Literal U+2212: f-string expressions cannot hold escapes before 3.12
+        f"{f' (+{pr.additions}/−{pr.deletions})' if pr.status in _OPEN_STATUSES else ''}"
     )
 
-    return "\n".join(lines)
+
+def _reviewed_pr_line(pr: ReviewedPR) -> str:
+    """Build a Markdown bullet line for a reviewed PR."""
+    return f"- `{pr.repo}` \u2014 {pr.title} #{pr.number} ({pr.author}) \u2014 **{pr.status}**"
+
+
+def _waiting_pr_line(pr: WaitingPR) -> str:
+    """Build a Markdown bullet line for a PR waiting for review."""
+    return (
+        f"- `{pr.repo}` \u2014 {pr.title} #{pr.number} \u2014 reviewer: "
+        f"{', '.join([f'**{r}**' for r in pr.reviewers])}"
+        f" \u2014 since {pr.created_at} ({pr.days_waiting} days)"
+    )
+
+
+_LINE_FORMATTERS = {
+    AuthoredPR: _authored_pr_line,
+    ReviewedPR: _reviewed_pr_line,
+    WaitingPR: _waiting_pr_line,
+}
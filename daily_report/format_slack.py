@@ -8,6 +8,7 @@ from __future__ import annotations
 import json
 import urllib.error
 import urllib.request
+from itertools import chain
 from urllib.parse import urlparse
 
 from daily_report.report_data import (
@@ -44,18 +45,17 @@ def format_slack(report: ReportData) -> dict:
 
     # Budget: reserve 2 blocks for summary section (section + divider before it)
     budget = _MAX_BLOCKS - len(blocks) - 2
-    sorted_repos = sorted(projects.keys())
     repos_added = 0
 
-    for repo_name in sorted_repos:
-        group = projects[repo_name]
+    for repo_name, group in projects.items():
         repo_blocks = _repo_blocks(
-            repo_name, group["authored"], group["reviewed"], group["waiting"],
+            repo_name, group.get("authored", ()), group.get("reviewed", ()),
+            group.get("waiting", ()),
         )
         # Each repo section also gets a trailing divider
         needed = len(repo_blocks) + 1
         if needed > budget:
-            remaining = len(sorted_repos) - repos_added
+            remaining = len(projects) - repos_added
             if remaining > 0:
                 blocks.append({
                     "type": "section",
@@ -218,19 +218,22 @@ def _group_by_repo(report: ReportData) -> dict[str, dict]:
     """Group all PR lists by repository name.
 
     Returns:
-        Dict mapping repo name to {"authored": [...], "reviewed": [...], "waiting": [...]}.
-        Only repos with at least one item are included.
+        Dict mapping repo name to {"authored": [...], "reviewed": [...], "waiting": [...]},
+        with keys inserted in sorted repo-name order.
+        Only repos with at least one item are included, and a section key is
+        present only if the repo has PRs in that section.
     """
-    projects: dict[str, dict] = {}
+    repo_names = {
+        pr.repo
+        for pr in chain(report.authored_prs, report.reviewed_prs, report.waiting_prs)
+    }
+    projects: dict[str, dict] = {name: {} for name in sorted(repo_names)}
     for pr in report.authored_prs:
-        projects.setdefault(pr.repo, {"authored": [], "reviewed": [], "waiting": []})
-        projects[pr.repo]["authored"].append(pr)
+        projects[pr.repo].setdefault("authored", []).append(pr)
     for pr in report.reviewed_prs:
-        projects.setdefault(pr.repo, {"authored": [], "reviewed": [], "waiting": []})
-        projects[pr.repo]["reviewed"].append(pr)
+        projects[pr.repo].setdefault("reviewed", []).append(pr)
     for pr in report.waiting_prs:
-        projects.setdefault(pr.repo, {"authored": [], "reviewed": [], "waiting": []})
-        projects[pr.repo]["waiting"].append(pr)
+        projects[pr.repo].setdefault("waiting", []).append(pr)
     return projects
 
 
@@ -252,7 +255,7 @@ def _reviewed_pr_line(pr: ReviewedPR) -> str:
 
 def _waiting_pr_line(pr: WaitingPR) -> str:
     """Build a Slack mrkdwn bullet line for a PR waiting for review."""
-    reviewers = ", ".join(f"*{r}*" for r in pr.reviewers)
+    reviewers = ", ".join([f"*{r}*" for r in pr.reviewers])
     return f"\u2022 {pr.title} #{pr.number} \u2014 reviewer: {reviewers} \u2014 {pr.days_waiting} days"
 
 
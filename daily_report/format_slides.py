@@ -5,14 +5,34 @@ Requires python-pptx: pip install python-pptx
 
 from __future__ import annotations
 
+import io
+from itertools import chain
+
 from pptx import Presentation
-from pptx.util import Inches, Pt
+from pptx.util import Inches
 from pptx.enum.text import PP_ALIGN
+from pptx.oxml.text import CT_TextParagraph
+from pptx.oxml.xmlchemy import OxmlElement
+from pptx.slide import Slide, SlideLayout
 
 from daily_report.report_data import (
     ReportData, AuthoredPR, ReviewedPR, WaitingPR,
 )
 
+# Statuses for which line additions/deletions are shown
+_OPEN_STATUSES = frozenset({"Open", "Draft"})
+
+# 16:9 slide dimensions, in EMU
+_SLIDE_WIDTH = Inches(13.333)
+_SLIDE_HEIGHT = Inches(7.5)
+
+# Run font sizes written straight to <a:rPr sz="...">, in hundredths of a point
+_SZ_14PT = "1400"
+_SZ_12PT = "1200"
+
+# Output file buffer size; zipfile emits many small writes while packaging
+_SAVE_BUFFER_SIZE = 1 << 20
+
 
 def format_slides(report: ReportData, output_path: str) -> None:
     """Render the report as a PPTX slide deck.
@@ -25,30 +45,37 @@ def format_slides(report: ReportData, output_path: str) -> None:
         OSError: If the file cannot be written (permissions, missing directory).
     """
     prs = Presentation()
-    prs.slide_width = Inches(13.333)
-    prs.slide_height = Inches(7.5)
+    prs.slide_width = _SLIDE_WIDTH
+    prs.slide_height = _SLIDE_HEIGHT
+
+    title_layout = prs.slide_layouts[0]  # Title Slide
+    content_layout = prs.slide_layouts[1]  # Title and Content
 
-    _add_title_slide(prs, report)
+    _add_title_slide(prs, title_layout, report)
 
     projects = _group_by_repo(report)
-    for repo_name in sorted(projects):
-        group = projects[repo_name]
+    for repo_name, group in projects.items():
         _add_project_slide(
-            prs, repo_name,
-            group["authored"], group["reviewed"], group["waiting"],
+            prs, content_layout, repo_name,
+            group.get("authored", ()), group.get("reviewed", ()),
+            group.get("waiting", ()),
         )
 
-    _add_summary_slide(prs, report)
+    _add_summary_slide(prs, content_layout, report)
 
-    prs.save(output_path)
+    # Package in memory, then hand the whole archive to the OS in one write
+    buf = io.BytesIO()
+    prs.save(buf)
+    with open(output_path, "wb", buffering=_SAVE_BUFFER_SIZE) as f:
+        f.write(buf.getbuffer())
 
 
 # --- internal helpers (private) ---
 
 
-def _add_title_slide(prs: Presentation, report: ReportData) -> None:
+def _add_title_slide(prs: Presentation, layout: SlideLayout,
+                     report: ReportData) -> None:
     """Add the title slide with user and date range."""
-    layout = prs.slide_layouts[0]  # Title Slide
     slide = prs.slides.add_slide(layout)
     slide.shapes.title.text = "Activity Report"
     if report.date_from == report.date_to:
@@ -58,68 +85,35 @@ def _add_title_slide(prs: Presentation, report: ReportData) -> None:
     slide.placeholders[1].text = subtitle_text
 
 
-def _add_project_slide(prs: Presentation, repo_name: str,
+def _add_project_slide(prs: Presentation, layout: SlideLayout, repo_name: str,
                         authored: list[AuthoredPR],
                         reviewed: list[ReviewedPR],
                         waiting: list[WaitingPR]) -> None:
     """Add a project slide with grouped bullet lists."""
-    layout = prs.slide_layouts[1]  # Title and Content
     slide = prs.slides.add_slide(layout)
     slide.shapes.title.text = repo_name
 
-    tf = slide.placeholders[1].text_frame
-    tf.clear()
-    first_paragraph = True
-
-    if authored:
-        p = tf.paragraphs[0] if first_paragraph else tf.add_paragraph()
-        first_paragraph = False
-        p.text = "Authored / Contributed"
-        p.level = 0
-        run = p.runs[0]
-        run.font.bold = True
-        run.font.size = Pt(14)
-
-        for pr in authored:
-            p = tf.add_paragraph()
-            p.text = _authored_pr_text(pr)
-            p.level = 1
-            p.runs[0].font.size = Pt(12)
-
-    if reviewed:
-        p = tf.paragraphs[0] if first_paragraph else tf.add_paragraph()
-        first_paragraph = False
-        p.text = "Reviewed"
-        p.level = 0
-        run = p.runs[0]
-        run.font.bold = True
-        run.font.size = Pt(14)
-
-        for pr in reviewed:
-            p = tf.add_paragraph()
-            p.text = _reviewed_pr_text(pr)
-            p.level = 1
-            p.runs[0].font.size = Pt(12)
-
-    if waiting:
-        p = tf.paragraphs[0] if first_paragraph else tf.add_paragraph()
-        first_paragraph = False
-        p.text = "Waiting for Review"
-        p.level = 0
-        run = p.runs[0]
-        run.font.bold = True
-        run.font.size = Pt(14)
-
-        for pr in waiting:
-            p = tf.add_paragraph()
-            p.text = _waiting_pr_text(pr)
-            p.level = 1
-            p.runs[0].font.size = Pt(12)
-
-
-def _add_summary_slide(prs: Presentation, report: ReportData) -> None:
+    sections = (
+        ("Authored / Contributed", authored, _authored_pr_text),
+        ("Reviewed", reviewed, _reviewed_pr_text),
+        ("Waiting for Review", waiting, _waiting_pr_text),
+    )
+
+    paragraphs = []
+    for header, items, to_text in sections:
+        if not items:
+            continue
+        paragraphs.append(_text_paragraph(header, 0, _SZ_14PT, bold=True))
+        paragraphs.extend(
+            _text_paragraph(to_text(pr), 1, _SZ_12PT) for pr in items
+        )
+
+    _set_body_paragraphs(slide, paragraphs)
+
+
+def _add_summary_slide(prs: Presentation, layout: SlideLayout,
+                       report: ReportData) -> None:
     """Add the summary slide with aggregate metrics."""
-    layout = prs.slide_layouts[1]  # Title and Content
     slide = prs.slides.add_slide(layout)
     slide.shapes.title.text = "Summary"
 
@@ -135,44 +129,76 @@ def _add_summary_slide(prs: Presentation, report: ReportData) -> None:
         f"Key themes: {themes_str}",
     ]
 
-    tf = slide.placeholders[1].text_frame
-    tf.clear()
-    for i, text in enumerate(bullets):
-        p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
-        p.text = text
-        p.level = 0
-        p.runs[0].font.size = Pt(14)
+    _set_body_paragraphs(
+        slide, [_text_paragraph(text, 0, _SZ_14PT) for text in bullets],
+    )
+
+
+def _text_paragraph(text: str, level: int, size: str,
+                    bold: bool = False) -> CT_TextParagraph:
+    """Build a detached <a:p> with one run of *text* at the given level and size.
+
+    Uses python-pptx's oxml element classes rather than the _Paragraph proxy,
+    so control characters and line breaks are handled as with ``p.text``.
+    """
+    p = OxmlElement("a:p")
+    pPr = p.get_or_add_pPr()
+    if level:
+        pPr.set("lvl", str(level))
+    p.append_text(text)
+    rPr = p.r_lst[0].get_or_add_rPr()
+    if bold:
+        rPr.set("b", "1")
+    rPr.set("sz", size)
+    return p
+
+
+def _set_body_paragraphs(slide: Slide, paragraphs: list) -> None:
+    """Replace the body placeholder's paragraphs with *paragraphs* in one go.
+
+    The txBody is looked up once and never re-read through the
+    ``TextFrame.paragraphs`` proxy list. A txBody must keep at least one
+    <a:p>, so an empty *paragraphs* leaves the placeholder untouched.
+    """
+    if not paragraphs:
+        return
+    txBody = slide.placeholders[1].text_frame._txBody
+    for p in txBody.p_lst:
+        txBody.remove(p)
+    txBody.extend(paragraphs)
 
 
 def _group_by_repo(report: ReportData) -> dict[str, dict]:
     """Group all PR lists by repository name.
 
     Returns:
-        Dict mapping repo name to {"authored": [...], "reviewed": [...], "waiting": [...]}.
-        Only repos with at least one item are included.
+        Dict mapping repo name to {"authored": [...], "reviewed": [...], "waiting": [...]},
+        with keys inserted in sorted repo-name order.
+        Only repos with at least one item are included, and a section key is
+        present only if the repo has PRs in that section.
     """
-    projects: dict[str, dict] = {}
+    repo_names = {
+        pr.repo
+        for pr in chain(report.authored_prs, report.reviewed_prs, report.waiting_prs)
+    }
+    projects: dict[str, dict] = {name: {} for name in sorted(repo_names)}
     for pr in report.authored_prs:
-        projects.setdefault(pr.repo, {"authored": [], "reviewed": [], "waiting": []})
-        projects[pr.repo]["authored"].append(pr)
+        projects[pr.repo].setdefault("authored", []).append(pr)
     for pr in report.reviewed_prs:
-        projects.setdefault(pr.repo, {"authored": [], "reviewed": [], "waiting": []})
-        projects[pr.repo]["reviewed"].append(pr)
+        projects[pr.repo].setdefault("reviewed", []).append(pr)
     for pr in report.waiting_prs:
-        projects.setdefault(pr.repo, {"authored": [], "reviewed": [], "waiting": []})
-        projects[pr.repo]["waiting"].append(pr)
+        projects[pr.repo].setdefault("waiting", []).append(pr)
     return projects
 
 
 def _authored_pr_text(pr: AuthoredPR) -> str:
     """Build bullet text for an authored/contributed PR."""
-    text = f"{pr.title} #{pr.number}"
-    if pr.contributed and pr.original_author:
-        text += f" ({pr.original_author})"
-    text += f" -- {pr.status}"
-    if pr.status in ("Open", "Draft"):
-        text += f" (+{pr.additions}/-{pr.deletions})"
-    return text
+    return (
+        f"{pr.title} #{pr.number}"
+        f"{f' ({pr.original_author})' if pr.contributed and pr.original_author else ''}"
+        f" -- {pr.status}"
+        f"{f' (+{pr.additions}/-{pr.deletions})' if pr.status in _OPEN_STATUSES else ''}"
+    )
 
 
 def _reviewed_pr_text(pr: ReviewedPR) -> str:
@@ -182,5 +208,7 @@ def _reviewed_pr_text(pr: ReviewedPR) -> str:
 
 def _waiting_pr_text(pr: WaitingPR) -> str:
     """Build bullet text for a PR waiting for review."""
-    reviewers = ", ".join(pr.reviewers)
-    return f"{pr.title} #{pr.number} -- reviewer: {reviewers} -- {pr.days_waiting} days"
+    return (
+        f"{pr.title} #{pr.number} -- reviewer: {', '.join(pr.reviewers)}"
+        f" -- {pr.days_waiting} days"
+    )
@@ -1,7 +1,15 @@
-"""Structured report data model, consumed by all formatters."""
+"""Structured report data model, consumed by all formatters.
+
+The per-PR classes declare ``__slots__`` explicitly (``dataclass(slots=True)``
+needs Python 3.10): no per-instance ``__dict__``, and faster attribute reads
+in the formatter loops. They also intern ``repo`` on construction, so the few
+repo names shared by many PRs are stored once and hash/compare by identity
+when the formatters group by repo.
+"""
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from typing import List, Optional
 
@@ -9,6 +17,10 @@ from typing import List, Optional
 @dataclass
 class AuthoredPR:
     """A PR authored or contributed to by the user."""
+    __slots__ = (
+        "repo", "title", "number", "status", "additions", "deletions",
+        "contributed", "original_author",
+    )
     repo: str
     title: str
     number: int
@@ -18,20 +30,30 @@ class AuthoredPR:
     contributed: bool        # True if user is contributor, not author
     original_author: Optional[str]  # PR author login when contributed=True
 
+    def __post_init__(self) -> None:
+        self.repo = sys.intern(self.repo)
+
 
 @dataclass
 class ReviewedPR:
     """A PR reviewed or approved by the user."""
+    __slots__ = ("repo", "title", "number", "author", "status")
     repo: str
     title: str
     number: int
     author: str              # PR author login
     status: str              # "Open", "Draft", "Merged", "Closed"
 
+    def __post_init__(self) -> None:
+        self.repo = sys.intern(self.repo)
+
 
 @dataclass
 class WaitingPR:
     """A PR authored by the user that is waiting for review."""
+    __slots__ = (
+        "repo", "title", "number", "reviewers", "created_at", "days_waiting",
+    )
     repo: str
     title: str
     number: int
@@ -39,6 +61,9 @@ class WaitingPR:
     created_at: str          # YYYY-MM-DD
     days_waiting: int
 
+    def __post_init__(self) -> None:
+        self.repo = sys.intern(self.repo)
+
 
 @dataclass
 class SummaryStats:
@@ -6,6 +6,7 @@ and CLI flag validation for the slides export feature.
 Run with: python3 -m pytest tests/test_formatters.py -v
 """
 
+import io
 import subprocess
 import sys
 from pathlib import Path
@@ -145,6 +146,26 @@ class TestReportDataConstruction:
         assert len(r.waiting_prs) == 1
         assert r.summary.total_prs == 4
 
+    def test_pr_classes_use_slots(self):
+        r = _make_full_report()
+        for pr in (r.authored_prs[0], r.reviewed_prs[0], r.waiting_prs[0]):
+            assert not hasattr(pr, "__dict__")
+            with pytest.raises(AttributeError):
+                pr.unknown_field = 1
+
+    def test_repo_name_interned(self):
+        # Build the name at runtime so it is not a shared compile-time constant
+        name = "".join(["org/", "interned"])
+        a = AuthoredPR(
+            repo=name, title="t", number=1, status="Open", additions=0,
+            deletions=0, contributed=False, original_author=None,
+        )
+        r = ReviewedPR(
+            repo="".join(["org/", "interned"]), title="t", number=2,
+            author="u", status="Open",
+        )
+        assert a.repo is r.repo
+
 
 # ---------------------------------------------------------------------------
 # format_markdown tests
@@ -340,6 +361,22 @@ class TestFormatMarkdownAdditionsDeletions:
         assert "(+0" not in line
 
 
+class TestFormatMarkdownStream:
+    """Writing to an output stream instead of returning a string."""
+
+    def test_stream_matches_returned_string(self):
+        report = _make_full_report()
+        buf = io.StringIO()
+        result = format_markdown(report, buf)
+        assert result is None
+        assert buf.getvalue() == format_markdown(report) + "\n"
+
+    def test_stream_empty_report(self):
+        buf = io.StringIO()
+        format_markdown(_make_report(), buf)
+        assert "_No PRs waiting for review._\n" in buf.getvalue()
+
+
 # ---------------------------------------------------------------------------
 # format_slides tests
 # ---------------------------------------------------------------------------
@@ -593,6 +630,39 @@ class TestFormatSlidesOpenVsMergedStats:
         assert "/-" not in merged_line
 
 
+class TestFormatSlidesBulletFormatting:
+    """Project slide paragraphs carry level, size and bold settings."""
+
+    @pytest.fixture(autouse=True)
+    def _generate(self, tmp_path):
+        report = _make_report(
+            authored_prs=[
+                AuthoredPR(
+                    repo="org/repo", title="Escape <tags> & \x0bchars", number=1,
+                    status="Merged", additions=0, deletions=0,
+                    contributed=False, original_author=None,
+                ),
+            ],
+        )
+        self.output_path = str(tmp_path / "bullets.pptx")
+        format_slides(report, self.output_path)
+        self.prs = Presentation(self.output_path)
+
+    def test_header_paragraph(self):
+        p = self.prs.slides[1].placeholders[1].text_frame.paragraphs[0]
+        assert p.text == "Authored / Contributed"
+        assert p.level == 0
+        assert p.runs[0].font.bold is True
+        assert p.runs[0].font.size.pt == 14
+
+    def test_bullet_paragraph(self):
+        p = self.prs.slides[1].placeholders[1].text_frame.paragraphs[1]
+        assert p.text.startswith("Escape <tags> & ")
+        assert "#1 -- Merged" in p.text
+        assert p.level == 1
+        assert p.runs[0].font.size.pt == 12
+
+
 # ---------------------------------------------------------------------------
 # CLI flag tests
 # ---------------------------------------------------------------------------